@@ -0,0 +1,90 @@
+"""
+Micro-benchmark: categorize_click vs. the vectorized categorize_job_docs
+
+Generates synthetic job documents, checks that both implementations return
+identical results and prints the timings for the per-job function, the
+document batch path and the columnar core on pre-extracted arrays.
+
+Usage: python benchmark_categorize.py [job_count]
+"""
+import os
+import sys
+import time
+import random
+
+import numpy as np
+
+# server.py reads these at import time; the benchmark never talks to MongoDB
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'printos_benchmark')
+
+from server import (  # noqa: E402
+    CATEGORIZE_COLUMNS,
+    categorize_click_columns,
+    categorize_job_docs,
+    categorize_stored_job
+)
+
+INK_COLORS = ["Cyan", "Magenta", "Yellow", "Black", "Orange", "Violet", "Green", "White"]
+
+
+def make_jobs(count: int, seed: int = 42) -> list:
+    """Build job documents with the same fields as print_jobs"""
+    rng = random.Random(seed)
+    jobs = []
+    for _ in range(count):
+        ink_count = rng.choice([0, 1, 2, 3, 4, 4, 4, 5, 6, 7])
+        jobs.append({
+            "one_shot_impressions": rng.choice([0, 0, rng.randint(1, 5000)]),
+            "impressions_1_color": rng.choice([0, 0, 0, rng.randint(1, 5000)]),
+            "impressions_2_colors": rng.choice([0, 0, 0, rng.randint(1, 5000)]),
+            "impressions_n_colors": rng.choice([0, rng.randint(1, 5000)]),
+            "inks": [{"color": color} for color in rng.sample(INK_COLORS, ink_count)]
+        })
+    return jobs
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"Generating {count:,} jobs...")
+    jobs = make_jobs(count)
+
+    start = time.perf_counter()
+    scalar = [categorize_stored_job(job) for job in jobs]
+    scalar_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized = categorize_job_docs(jobs)
+    vectorized_seconds = time.perf_counter() - start
+
+    columns = [np.array([job[field] for job in jobs]) for field in CATEGORIZE_COLUMNS]
+    ink_counts = np.array([len(job["inks"]) for job in jobs])
+    has_black = np.array([any(ink["color"].lower() == "black" for ink in job["inks"]) for job in jobs])
+
+    start = time.perf_counter()
+    columnar = categorize_click_columns(*columns, ink_counts, has_black)
+    columnar_seconds = time.perf_counter() - start
+
+    columnar_results = [
+        {"is_oneshot": a, "is_epm": b, "click_category": c}
+        for a, b, c in zip(
+            columnar["is_oneshot"].tolist(),
+            columnar["is_epm"].tolist(),
+            columnar["click_category"].tolist()
+        )
+    ]
+
+    for name, results in [("categorize_job_docs", vectorized), ("categorize_click_columns", columnar_results)]:
+        mismatches = sum(1 for a, b in zip(scalar, results) if a != b)
+        if mismatches:
+            print(f"MISMATCH: {name} differs for {mismatches:,} jobs")
+            sys.exit(1)
+
+    print(f"categorize_click (per job):        {scalar_seconds:.2f} s")
+    print(f"categorize_job_docs (documents):   {vectorized_seconds:.2f} s  ({scalar_seconds / vectorized_seconds:.1f}x)")
+    print(f"categorize_click_columns (arrays): {columnar_seconds:.3f} s  ({scalar_seconds / columnar_seconds:.1f}x)")
+    print("Results identical")
+
+
+if __name__ == "__main__":
+    main()
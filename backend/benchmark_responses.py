@@ -0,0 +1,127 @@
+"""
+Micro-benchmark: JSON serialization and compression of large API responses
+
+Builds payloads shaped like /jobs, /clicks/trend (multi-year daily data) and
+/analysis/availability and prints, per payload, the time FastAPI spends
+turning the returned dict into bytes with the stdlib JSON response, with
+ORJSONResponse after jsonable_encoder and with ORJSONResponse alone, plus
+the gzip size and time at the middleware's compression level.
+
+Usage: python benchmark_responses.py [repeat]
+"""
+import os
+import sys
+import gzip
+import time
+import random
+from datetime import date, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+# server.py reads these at import time; the benchmark never talks to MongoDB
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'printos_benchmark')
+
+from server import GZIP_COMPRESS_LEVEL  # noqa: E402
+
+
+def make_jobs(count: int, rng: random.Random) -> dict:
+    """A /jobs page with full print_jobs documents"""
+    jobs = []
+    for i in range(count):
+        jobs.append({
+            "marker": 1_000_000 + i,
+            "press_id": rng.choice(["47200413", "47100144", "47100122"]),
+            "job_name": f"Auftrag_{i}_{rng.randint(1000, 9999)}.pdf",
+            "status": rng.choice(["PRINTED", "ABORTED", "PRINTING"]),
+            "submit_time": f"2024-05-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:15:00",
+            "total_impressions": rng.randint(1, 20000),
+            "one_shot_impressions": rng.randint(0, 5000),
+            "impressions_1_color": 0,
+            "impressions_2_colors": 0,
+            "impressions_n_colors": rng.randint(0, 20000),
+            "is_oneshot": rng.random() < 0.3,
+            "is_epm": rng.random() < 0.2,
+            "click_category": rng.choice(["1 Color", "2 Colors", "EPM", "Multicolor"]),
+            "inks": [{"color": color, "consumption": rng.random() * 10} for color in ["Cyan", "Magenta", "Yellow", "Black"]],
+            "substrates": [{"name": "Bilderdruck 135g", "width": 330, "height": 480}],
+            "copies": rng.randint(1, 500),
+            "duplex": rng.random() < 0.5
+        })
+    return {"jobs": jobs, "total": count, "page": 1, "limit": count, "pages": 1}
+
+
+def make_trend(days: int, rng: random.Random) -> list:
+    """/clicks/trend with daily resolution"""
+    start = date(2020, 1, 1)
+    return [
+        {
+            "date": (start + timedelta(days=i)).isoformat(),
+            "1 Color": rng.randint(0, 5000),
+            "2 Colors": rng.randint(0, 5000),
+            "EPM": rng.randint(0, 50000),
+            "Multicolor": rng.randint(0, 200000)
+        }
+        for i in range(days)
+    ]
+
+
+def make_availability(days: int, rng: random.Random) -> dict:
+    """/analysis/availability for a long date range"""
+    start = date(2020, 1, 1)
+    dates = [(start + timedelta(days=i)).isoformat() for i in range(days)]
+    return {
+        "availability": {
+            "average": 93.4,
+            "trend": [{"date": d, "value": round(rng.uniform(80, 100), 1)} for d in dates]
+        },
+        "technicalIssues": {
+            "failureRate": {"average": 12.5, "max": 80.1},
+            "paperJamRate": {"average": 3.2, "max": 20.7},
+            "dailyData": [
+                {"date": d, "failures": round(rng.uniform(0, 50), 2), "jams": round(rng.uniform(0, 20), 2),
+                 "failures_count": rng.randint(0, 10), "jams_count": rng.randint(0, 5)}
+                for d in dates
+            ]
+        },
+        "restarts": {
+            "averageRate": 1.2,
+            "max": 6,
+            "dailyData": [{"date": d, "restarts": rng.randint(0, 6)} for d in dates]
+        }
+    }
+
+
+def timed(function, repeat: int) -> tuple:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return result, (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    rng = random.Random(42)
+    payloads = {
+        "/jobs (5000 jobs)": make_jobs(5000, rng),
+        "/clicks/trend (5 years daily)": make_trend(5 * 365, rng),
+        "/analysis/availability (5 years)": make_availability(5 * 365, rng)
+    }
+
+    for name, payload in payloads.items():
+        body, stdlib_ms = timed(lambda: JSONResponse(jsonable_encoder(payload)).body, repeat)
+        _, encoded_orjson_ms = timed(lambda: ORJSONResponse(jsonable_encoder(payload)).body, repeat)
+        fast_body, orjson_ms = timed(lambda: ORJSONResponse(payload).body, repeat)
+        compressed, gzip_ms = timed(lambda: gzip.compress(fast_body, compresslevel=GZIP_COMPRESS_LEVEL), repeat)
+
+        print(name)
+        print(f"  jsonable_encoder + json:    {stdlib_ms:8.2f} ms  {len(body) / 1024:8.1f} KB")
+        print(f"  jsonable_encoder + orjson:  {encoded_orjson_ms:8.2f} ms")
+        print(f"  orjson only:                {orjson_ms:8.2f} ms  ({stdlib_ms / orjson_ms:.0f}x)")
+        print(f"  gzip level {GZIP_COMPRESS_LEVEL}:               {gzip_ms:8.2f} ms  {len(compressed) / 1024:8.1f} KB"
+              f"  ({len(compressed) / len(fast_body) * 100:.0f}% of orjson body)")
+
+
+if __name__ == "__main__":
+    main()
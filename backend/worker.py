@@ -0,0 +1,172 @@
+"""
+Standalone sync/ingest worker for the HP PrintOS Dashboard
+
+Runs the background work of server.py - leader election, job sync with
+catch-up backfill and the categorization upgrade - outside the web
+process, so request handling never competes with sync bursts. Start the
+web tier with RUN_BACKGROUND_TASKS=false when this worker is deployed.
+
+Every task is supervised: a crashed task is restarted with backoff. On
+SIGTERM/SIGINT all tasks are cancelled, sync checkpoints are written and
+leases are released so another worker can take over immediately.
+
+GET /health on WORKER_HEALTH_PORT reports the state of every task.
+
+Usage: python worker.py
+"""
+import os
+import json
+import time
+import signal
+import asyncio
+import logging
+from datetime import datetime, timezone
+
+from server import (
+    INSTANCE_ID,
+    client,
+    db,
+    ensure_indexes,
+    flush_logs,
+    get_api_credentials,
+    held_leases,
+    lease_loop,
+    load_devices_from_db,
+    log_flush_loop,
+    release_lease,
+    stop_local_sync,
+    stop_maintenance_tasks
+)
+
+logger = logging.getLogger("worker")
+
+WORKER_HEALTH_PORT = int(os.environ.get('WORKER_HEALTH_PORT', '8081'))
+# Longest wait before a crashed task is restarted
+WORKER_MAX_RESTART_DELAY = float(os.environ.get('WORKER_MAX_RESTART_DELAY', '300'))
+
+# Coroutine factories of the supervised tasks; sync and maintenance run under lease_loop
+WORKER_TASKS = {
+    "leases": lease_loop,
+    "logs": log_flush_loop,
+}
+
+# Task name -> running, restarts, last error
+task_status = {}
+
+
+async def supervise(name: str, factory):
+    """Run factory() forever, restarting it with exponential backoff when it fails"""
+    status = task_status.setdefault(name, {"running": False, "restarts": 0, "last_error": None})
+    delay = 1.0
+    while True:
+        started = time.monotonic()
+        status["running"] = True
+        try:
+            await factory()
+            logger.warning(f"Task {name} returned, restarting")
+        except asyncio.CancelledError:
+            status["running"] = False
+            raise
+        except Exception as e:
+            logger.error(f"Task {name} crashed: {e}")
+            status["last_error"] = str(e)
+        status["running"] = False
+        status["restarts"] += 1
+
+        # A task that ran for a while before failing starts over with a short delay
+        if time.monotonic() - started > WORKER_MAX_RESTART_DELAY:
+            delay = 1.0
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, WORKER_MAX_RESTART_DELAY)
+
+
+async def health_status() -> dict:
+    """Health of the database connection and every supervised task"""
+    try:
+        await db.command("ping")
+        database = "connected"
+    except Exception:
+        database = "unavailable"
+
+    healthy = database == "connected" and all(status["running"] for status in task_status.values())
+    return {
+        "status": "healthy" if healthy else "unhealthy",
+        "database": database,
+        "instance_id": INSTANCE_ID,
+        "leases": sorted(held_leases),
+        "tasks": task_status,
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
+
+
+async def handle_health_request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Minimal HTTP handler: GET /health returns health_status() as JSON"""
+    try:
+        request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+        parts = request_line.decode("latin-1").split()
+        if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] == "/health":
+            health = await health_status()
+            code = "200 OK" if health["status"] == "healthy" else "503 Service Unavailable"
+            body = json.dumps(health).encode()
+        else:
+            code = "404 Not Found"
+            body = b'{"detail": "Not Found"}'
+        writer.write(
+            f"HTTP/1.1 {code}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+        )
+        await writer.drain()
+    except (asyncio.TimeoutError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def shutdown(tasks: list):
+    """Cancel all tasks, checkpoint the running sync and hand over leases"""
+    logger.info("Worker shutting down")
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Cancelling the sync writes its checkpoint, see sync_device_jobs; the
+    # categorization upgrade and resync runs persist their progress the same way
+    await stop_local_sync()
+    await stop_maintenance_tasks()
+    await flush_logs()
+    for name in list(held_leases):
+        try:
+            await release_lease(name)
+        except Exception as e:
+            logger.error(f"Error releasing lease {name}: {e}")
+    client.close()
+
+
+async def main():
+    await load_devices_from_db()
+    await ensure_indexes()
+    await get_api_credentials()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            # Windows: Ctrl+C still raises KeyboardInterrupt
+            pass
+
+    health_server = await asyncio.start_server(handle_health_request, "0.0.0.0", WORKER_HEALTH_PORT)
+    tasks = [asyncio.create_task(supervise(name, factory)) for name, factory in WORKER_TASKS.items()]
+    logger.info(f"Worker {INSTANCE_ID} started, health on port {WORKER_HEALTH_PORT}")
+
+    try:
+        await stop.wait()
+    finally:
+        health_server.close()
+        await shutdown(tasks)
+    logger.info("Worker stopped")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,28 @@
+import { useEffect, useRef } from 'react';
+
+import { API_URL } from '@/config';
+
+// Subscribes to the server-sent live events (/api/events).
+// handlers maps event types (press_status, today_counters, sync, sync_control) to callbacks;
+// EventSource reconnects on its own and resumes from the last received event.
+export const useLiveEvents = (handlers) => {
+  const handlersRef = useRef(handlers);
+  handlersRef.current = handlers;
+
+  useEffect(() => {
+    const source = new EventSource(API_URL + '/events');
+
+    Object.keys(handlersRef.current).forEach((type) => {
+      source.addEventListener(type, (event) => {
+        const handler = handlersRef.current[type];
+        if (handler) {
+          handler(JSON.parse(event.data));
+        }
+      });
+    });
+
+    return () => source.close();
+  }, []);
+};
+
+export default useLiveEvents;
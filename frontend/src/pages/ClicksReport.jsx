@@ -43,6 +43,8 @@ import { useDevices } from "@/hooks/useDevices";
 
 import { API_URL } from '@/config';
 
+const REFRESH_POLL_INTERVAL = 2000;
+
 const COLORS = {
   "1 Color": "#06b6d4",
   "2 Colors": "#d946ef",
@@ -106,13 +108,7 @@ export default function ClicksReport({ selectedDevice }) {
 
   useEffect(() => {
     fetchData();
-  }, [selectedDevice, isOneShot, dateRange, resolution]);
-
-  useEffect(() => {
-    if (showYoY) {
-      fetchYoYData();
-    }
-  }, [showYoY, selectedDevice, dateRange, currentYear, previousYear]);
+  }, [selectedDevice, isOneShot, dateRange, resolution, showYoY, currentYear, previousYear]);
 
   const fetchData = async () => {
     setLoading(true);
@@ -127,14 +123,23 @@ export default function ClicksReport({ selectedDevice }) {
         from_date: fromDate,
         to_date: toDate
       };
+      if (showYoY) {
+        params.yoy = true;
+        params.current_year = currentYear;
+        params.previous_year = previousYear;
+      }
       
-      const [reportRes, trendRes] = await Promise.all([
-        axios.get(`${API_URL}/clicks/report`, { params }),
-        axios.get(`${API_URL}/clicks/trend`, { params })
-      ]);
-      
-      setReport(reportRes.data);
-      setTrend(trendRes.data);
+      // Report, trend and the year comparison arrive in one (cached) request
+      const res = await axios.get(`${API_URL}/clicks/bundle`, { params });
+      setReport(res.data.clicks_report);
+      setTrend(res.data.clicks_trend);
+      if (showYoY) {
+        setYoyData(res.data.yoy);
+        setYoyTrend(res.data.yoy_trend);
+        if (res.data.yoy_error) {
+          toast.error("Fehler beim Laden des Jahresvergleichs");
+        }
+      }
     } catch (error) {
       console.error("Error fetching clicks data:", error);
       toast.error("Fehler beim Laden der Clicks-Daten");
@@ -143,31 +148,14 @@ export default function ClicksReport({ selectedDevice }) {
     }
   };
 
-  const fetchYoYData = async () => {
-    try {
-      const params = { 
-        device_id: selectedDevice,
-        current_year: currentYear,
-        previous_year: previousYear
-      };
-      
-      if (dateRange.from) {
-        params.from_date = format(dateRange.from, "yyyy-MM-dd");
-      }
-      if (dateRange.to) {
-        params.to_date = format(dateRange.to, "yyyy-MM-dd");
+  const pollRefreshStatus = async (refreshId) => {
+    // The refresh waits for the HP rate limit and runs in the background
+    while (true) {
+      await new Promise(resolve => setTimeout(resolve, REFRESH_POLL_INTERVAL));
+      const response = await axios.get(`${API_URL}/data/refresh/${refreshId}`);
+      if (response.data.status === "completed" || response.data.status === "failed") {
+        return response.data;
       }
-
-      const [yoyRes, yoyTrendRes] = await Promise.all([
-        axios.get(`${API_URL}/clicks/yoy`, { params }),
-        axios.get(`${API_URL}/clicks/yoy/trend`, { params })
-      ]);
-      
-      setYoyData(yoyRes.data);
-      setYoyTrend(yoyTrendRes.data);
-    } catch (error) {
-      console.error("Error fetching YoY data:", error);
-      toast.error("Fehler beim Laden der Jahresvergleich-Daten");
     }
   };
 
@@ -187,15 +175,18 @@ export default function ClicksReport({ selectedDevice }) {
       }
 
       const res = await axios.post(`${API_URL}/data/refresh`, null, { params });
+      const refresh = await pollRefreshStatus(res.data.refresh_id);
       
-      if (res.data.total_synced > 0) {
-        toast.success(`${res.data.total_synced} neue Jobs von der API geladen`);
+      if (refresh.status === "failed") {
+        toast.error("Fehler beim Aktualisieren: " + refresh.error);
+      } else if (refresh.total_synced > 0) {
+        toast.success(`${refresh.total_synced} neue Jobs von der API geladen`);
       } else {
-        const synced = res.data.results?.filter(r => r.status === "synced");
+        const synced = refresh.results?.filter(r => r.status === "synced");
         if (synced?.length > 0) {
           toast.info("API abgefragt, keine neuen Jobs gefunden");
         } else {
-          toast.info(res.data.message || "Keine neuen Daten verfügbar");
+          toast.info(refresh.message || "Keine neuen Daten verfügbar");
         }
       }
       
@@ -1,4 +1,4 @@
-import { useState, useEffect, useRef } from "react";
+import { useState, useEffect } from "react";
 import axios from "axios";
 import { toast } from "sonner";
 import { format } from "date-fns";
@@ -29,6 +29,7 @@ import {
   Legend
 } from "recharts";
 import { useDevices } from "@/hooks/useDevices";
+import { useLiveEvents } from "@/hooks/useLiveEvents";
 
 import { API_URL } from '@/config';
 
@@ -49,7 +50,6 @@ export default function Dashboard({ selectedDevice }) {
   const [bgSyncRunning, setBgSyncRunning] = useState(false);
   const [recentSyncs, setRecentSyncs] = useState([]);
   const [chartsMounted, setChartsMounted] = useState(false);
-  const lastSyncCountRef = useRef(0);
 
   useEffect(() => {
     // Wichtig: Warten bis CSS Grid fertig gerendert ist
@@ -61,44 +61,30 @@ export default function Dashboard({ selectedDevice }) {
 
   useEffect(() => {
     fetchData();
+  }, [selectedDevice, dateRange]);
+
+  useEffect(() => {
     checkSyncStatus();
-    
-    // Poll for sync status updates when background sync is running
-    const interval = setInterval(() => {
-      if (bgSyncRunning) {
-        checkSyncStatus();
-      }
-    }, 10000); // Check every 10 seconds
-    
-    return () => clearInterval(interval);
-  }, [selectedDevice, dateRange, bgSyncRunning]);
+  }, []);
+
+  // Sync progress is pushed by the server instead of polling /sync/status
+  useLiveEvents({
+    sync: (event) => {
+      setRecentSyncs((syncs) => [event, ...syncs].slice(0, 3));
+      toast.success(`${event.device_name}: ${event.jobs_synced} neue Jobs synchronisiert`, {
+        duration: 3000,
+      });
+      // Refresh data after new sync
+      fetchData();
+    },
+    sync_control: (event) => setBgSyncRunning(event.enabled)
+  });
 
   const checkSyncStatus = async () => {
     try {
       const res = await axios.get(`${API_URL}/sync/status`);
       setBgSyncRunning(res.data.running);
-      
-      const logs = res.data.recent_logs || [];
-      setRecentSyncs(logs.slice(0, 3));
-      
-      // Show notification for new syncs
-      if (logs.length > 0 && lastSyncCountRef.current > 0) {
-        const latestSync = logs[0];
-        const currentTimestamp = new Date(latestSync.timestamp).getTime();
-        const lastTimestamp = lastSyncCountRef.current;
-        
-        if (currentTimestamp > lastTimestamp && latestSync.jobs_synced > 0) {
-          toast.success(`${latestSync.device_name}: ${latestSync.jobs_synced} neue Jobs synchronisiert`, {
-            duration: 3000,
-          });
-          // Refresh data after new sync
-          fetchData();
-        }
-      }
-      
-      if (logs.length > 0) {
-        lastSyncCountRef.current = new Date(logs[0].timestamp).getTime();
-      }
+      setRecentSyncs((res.data.recent_logs || []).slice(0, 3));
     } catch (error) {
       console.log("Sync status check failed");
     }
@@ -112,9 +98,8 @@ export default function Dashboard({ selectedDevice }) {
         setBgSyncRunning(false);
       } else {
         await axios.post(`${API_URL}/sync/start`);
-        toast.success("Background Sync gestartet - Alle 35 Sek. werden neue Jobs synchronisiert");
+        toast.success("Background Sync gestartet - neue Jobs werden laufend synchronisiert");
         setBgSyncRunning(true);
-        lastSyncCountRef.current = Date.now();
       }
     } catch (error) {
       toast.error("Fehler beim Umschalten des Background Sync");
@@ -134,26 +119,15 @@ export default function Dashboard({ selectedDevice }) {
         params.to_date = format(dateRange.to, "yyyy-MM-dd");
       }
 
-      const statsRes = await axios.get(`${API_URL}/stats/overview`, { params });
-      setStats(statsRes.data);
-      
-      // Fetch trend data for chart
-      try {
-        const trendRes = await axios.get(`${API_URL}/clicks/trend`, { params });
-        if (trendRes.data && trendRes.data.length > 0) {
-          const chartData = trendRes.data.map(item => ({
-            date: item.date,
-            impressions: (item["1 Color"] || 0) + (item["2 Colors"] || 0) + 
-                        (item["EPM"] || 0) + (item["Multicolor"] || 0)
-          }));
-          setPerformance(chartData);
-        } else {
-          setPerformance([]);
-        }
-      } catch (trendError) {
-        console.log("Trend data unavailable");
-        setPerformance([]);
-      }
+      // Overview and trend arrive in one (cached) request
+      const res = await axios.get(`${API_URL}/dashboard`, { params });
+      const { overview, clicks_trend } = res.data;
+      setStats(overview);
+      setPerformance((clicks_trend || []).map(item => ({
+        date: item.date,
+        impressions: (item["1 Color"] || 0) + (item["2 Colors"] || 0) +
+                    (item["EPM"] || 0) + (item["Multicolor"] || 0)
+      })));
     } catch (error) {
       console.error("Error fetching dashboard data:", error);
       setStats({
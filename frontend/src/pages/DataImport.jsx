@@ -34,10 +34,31 @@ import { API_URL } from '@/config';
 // URL to the Python script for download
 const PYTHON_SCRIPT_URL = "https://customer-assets.emergentagent.com/job_780f423f-33d7-4575-8f0c-1dd9c8d51e1e/artifacts/38ttw7v7_complete_job_analytics_30sec_OFFICIAL_interactive.py";
 
+// Accepted import formats (JSON array, NDJSON, optionally gzip-compressed)
+const IMPORT_FILE_EXTENSIONS = ['.json', '.ndjson', '.jsonl', '.json.gz', '.ndjson.gz', '.jsonl.gz'];
+
+// Files above this size are not parsed in the browser for the preview
+const PREVIEW_PARSE_LIMIT = 20 * 1024 * 1024;
+
+// Polling interval for background import progress (ms)
+const IMPORT_POLL_INTERVAL = 1000;
+
+const formatDuration = (seconds) => {
+  if (seconds == null) return "-";
+  if (seconds < 60) return `${Math.round(seconds)} s`;
+  return `${Math.floor(seconds / 60)} min ${Math.round(seconds % 60)} s`;
+};
+
+const formatFileSize = (bytes) => {
+  if (bytes >= 1024 * 1024) return (bytes / (1024 * 1024)).toFixed(2) + " MB";
+  return (bytes / 1024).toFixed(2) + " KB";
+};
+
 export default function DataImport() {
   const [file, setFile] = useState(null);
   const [importing, setImporting] = useState(false);
   const [progress, setProgress] = useState(0);
+  const [importStatus, setImportStatus] = useState(null);
   const [result, setResult] = useState(null);
   const [preview, setPreview] = useState(null);
   const [dragActive, setDragActive] = useState(false);
@@ -75,26 +96,41 @@ export default function DataImport() {
   const processFile = async (selectedFile) => {
     if (!selectedFile) return;
     
-    if (!selectedFile.name.endsWith('.json')) {
-      toast.error("Bitte nur JSON-Dateien hochladen");
+    const name = selectedFile.name.toLowerCase();
+    if (!IMPORT_FILE_EXTENSIONS.some(ext => name.endsWith(ext))) {
+      toast.error("Bitte nur JSON-, NDJSON- oder gzip-Dateien hochladen");
       return;
     }
 
     setFile(selectedFile);
     setResult(null);
 
+    const basePreview = {
+      fileName: selectedFile.name,
+      fileSize: formatFileSize(selectedFile.size),
+      jobCount: null,
+      sampleJob: null
+    };
+
+    // Large and compressed files are streamed to the server unparsed,
+    // so the preview only inspects what is cheap to read in the browser
+    if (name.endsWith('.gz')) {
+      setPreview(basePreview);
+      return;
+    }
+
     try {
-      const text = await selectedFile.text();
-      const data = JSON.parse(text);
-      
-      const jobs = Array.isArray(data) ? data : [data];
-      
-      setPreview({
-        fileName: selectedFile.name,
-        fileSize: (selectedFile.size / 1024).toFixed(2) + " KB",
-        jobCount: jobs.length,
-        sampleJob: jobs[0]
-      });
+      if (name.endsWith('.json') && selectedFile.size <= PREVIEW_PARSE_LIMIT) {
+        const data = JSON.parse(await selectedFile.text());
+        const jobs = Array.isArray(data) ? data : [data];
+        setPreview({ ...basePreview, jobCount: jobs.length, sampleJob: jobs[0] });
+      } else if (name.endsWith('.json')) {
+        setPreview(basePreview);
+      } else {
+        const head = await selectedFile.slice(0, 64 * 1024).text();
+        const firstLine = head.split('\n').find(line => line.trim());
+        setPreview({ ...basePreview, sampleJob: firstLine ? JSON.parse(firstLine) : null });
+      }
     } catch (error) {
       toast.error("Fehler beim Lesen der JSON-Datei");
       setFile(null);
@@ -117,36 +153,58 @@ export default function DataImport() {
     }
   };
 
+  const pollImportStatus = async (importId) => {
+    // Poll the background import until it finishes
+    while (true) {
+      await new Promise(resolve => setTimeout(resolve, IMPORT_POLL_INTERVAL));
+      const response = await axios.get(`${API_URL}/jobs/import/${importId}`);
+      const status = response.data;
+      setImportStatus(status);
+      setProgress(Math.round(status.percent || 0));
+      if (status.status === "completed" || status.status === "failed") {
+        return status;
+      }
+    }
+  };
+
   const handleImport = async () => {
     if (!file) return;
 
     setImporting(true);
     setProgress(0);
     setResult(null);
+    setImportStatus({ status: "uploading", percent: 0 });
 
     try {
-      const text = await file.text();
-      const data = JSON.parse(text);
-      const jobs = Array.isArray(data) ? data : [data];
-
-      const progressInterval = setInterval(() => {
-        setProgress(prev => Math.min(prev + 10, 90));
-      }, 200);
-
-      const response = await axios.post(`${API_URL}/jobs/import`, { jobs });
-
-      clearInterval(progressInterval);
-      setProgress(100);
-
-      setResult({
-        success: true,
-        imported: response.data.imported,
-        updated: response.data.updated,
-        skipped: response.data.skipped,
-        errors: response.data.errors
+      // The file is uploaded as-is and processed by a background task on the server
+      const response = await axios.post(`${API_URL}/jobs/import/async`, file, {
+        headers: { 'Content-Type': 'application/octet-stream' },
+        onUploadProgress: (event) => {
+          if (event.total) {
+            setImportStatus({ status: "uploading", percent: (event.loaded / event.total) * 100 });
+          }
+        }
       });
 
-      toast.success(`${response.data.imported} Jobs importiert`);
+      const status = await pollImportStatus(response.data.import_id);
+
+      if (status.status === "failed") {
+        setResult({
+          success: false,
+          error: `${status.error} (${status.processed} Jobs verarbeitet)`
+        });
+        toast.error("Import fehlgeschlagen");
+      } else {
+        setProgress(100);
+        setResult({
+          success: true,
+          imported: status.imported,
+          updated: status.updated,
+          skipped: status.skipped,
+          errors: status.errors
+        });
+        toast.success(`${status.imported} Jobs importiert`);
+      }
       
       // Refresh history
       fetchHistory();
@@ -159,6 +217,7 @@ export default function DataImport() {
       toast.error("Import fehlgeschlagen");
     } finally {
       setImporting(false);
+      setImportStatus(null);
     }
   };
 
@@ -167,6 +226,7 @@ export default function DataImport() {
     setPreview(null);
     setResult(null);
     setProgress(0);
+    setImportStatus(null);
   };
 
   const formatDate = (dateStr) => {
@@ -336,7 +396,7 @@ export default function DataImport() {
               JSON-Datei hochladen
             </CardTitle>
             <CardDescription className="text-slate-400">
-              Unterstützt JSON-Dateien mit einzelnen Jobs oder Job-Arrays
+              Unterstützt JSON-Arrays, NDJSON und gzip-komprimierte Exporte
             </CardDescription>
           </CardHeader>
           <CardContent>
@@ -380,7 +440,7 @@ export default function DataImport() {
                         durchsuchen
                         <input
                           type="file"
-                          accept=".json"
+                          accept=".json,.ndjson,.jsonl,.gz"
                           onChange={handleFileChange}
                           className="hidden"
                           data-testid="file-input"
@@ -388,7 +448,7 @@ export default function DataImport() {
                       </label>
                     </p>
                     <p className="text-slate-500 text-sm mt-1">
-                      Nur .json Dateien (z.B. all_jobs_*.json)
+                      .json, .ndjson oder .gz Dateien (z.B. all_jobs_*.json)
                     </p>
                   </div>
                 </div>
@@ -402,7 +462,7 @@ export default function DataImport() {
                 <div className="grid grid-cols-2 gap-4 text-sm">
                   <div className="bg-slate-800 p-3 rounded">
                     <p className="text-slate-400">Anzahl Jobs</p>
-                    <p className="text-white font-mono text-lg">{preview.jobCount}</p>
+                    <p className="text-white font-mono text-lg">{preview.jobCount ?? "-"}</p>
                   </div>
                   <div className="bg-slate-800 p-3 rounded">
                     <p className="text-slate-400">Beispiel Presse</p>
@@ -442,7 +502,7 @@ export default function DataImport() {
                 ) : (
                   <>
                     <Upload className="w-4 h-4 mr-2" />
-                    {preview?.jobCount} Jobs importieren
+                    {preview?.jobCount != null ? `${preview.jobCount} Jobs importieren` : "Jobs importieren"}
                   </>
                 )}
               </Button>
@@ -451,8 +511,35 @@ export default function DataImport() {
             {/* Progress */}
             {importing && (
               <div className="mt-4">
-                <Progress value={progress} className="h-2" />
-                <p className="text-slate-400 text-sm mt-2 text-center">{progress}%</p>
+                {importStatus?.status === "uploading" ? (
+                  <>
+                    <Progress value={importStatus.percent} className="h-2" />
+                    <p className="text-slate-400 text-sm mt-2 text-center">
+                      Hochladen... {Math.round(importStatus.percent)}%
+                    </p>
+                  </>
+                ) : (
+                  <>
+                    <Progress value={progress} className="h-2" />
+                    <p className="text-slate-400 text-sm mt-2 text-center">{progress}%</p>
+                    {importStatus && (
+                      <div className="grid grid-cols-3 gap-2 mt-3 text-xs text-center" data-testid="import-progress">
+                        <div className="bg-slate-800 p-2 rounded">
+                          <p className="text-white font-mono">{importStatus.processed ?? 0}</p>
+                          <p className="text-slate-400">Verarbeitet</p>
+                        </div>
+                        <div className="bg-slate-800 p-2 rounded">
+                          <p className="text-white font-mono">{importStatus.jobs_per_second ?? 0}/s</p>
+                          <p className="text-slate-400">Durchsatz</p>
+                        </div>
+                        <div className="bg-slate-800 p-2 rounded">
+                          <p className="text-white font-mono">{formatDuration(importStatus.eta_seconds)}</p>
+                          <p className="text-slate-400">Restzeit</p>
+                        </div>
+                      </div>
+                    )}
+                  </>
+                )}
               </div>
             )}
 
@@ -536,6 +623,10 @@ export default function DataImport() {
                       <div>
                         <p className="text-white text-sm font-mono">
                           {log.imported} importiert, {log.updated} aktualisiert
+                          {log.status === "failed" && <span className="text-rose-400 ml-2">Fehler</span>}
+                          {(log.status === "queued" || log.status === "running") && (
+                            <span className="text-amber-400 ml-2">läuft ({log.percent}%)</span>
+                          )}
                         </p>
                         <p className="text-slate-400 text-xs flex items-center gap-1">
                           <Clock className="w-3 h-3" />
@@ -618,7 +709,8 @@ export default function DataImport() {
 }`}
               </pre>
               <div className="text-xs text-slate-500 mt-3 space-y-1">
-                <p>• Einzelner Job oder Array von Jobs</p>
+                <p>• Einzelner Job, Array von Jobs oder ein Job pro Zeile (NDJSON)</p>
+                <p>• Große Exporte können als <code className="bg-slate-700 px-1 rounded">.gz</code> hochgeladen werden</p>
                 <p>• <code className="bg-slate-700 px-1 rounded">marker</code> wird als eindeutige ID verwendet</p>
                 <p>• Click-Kategorien werden automatisch berechnet</p>
               </div>
@@ -1,5 +1,6 @@
 import { useState, useEffect } from "react";
 import { useDevices } from "@/hooks/useDevices";
+import { useLiveEvents } from "@/hooks/useLiveEvents";
 import axios from "axios";
 import { toast } from "sonner";
 import { 
@@ -25,6 +26,49 @@ const DEVICE_MODELS = {
   "47100122": "HP Indigo 9129"
 };
 
+// Map a device record of /devices/status or a press_status event to the card state
+const toLiveState = (device) => {
+  const data = device.status;
+  const todayFromJobs = device.today_from_jobs || {};
+  
+  if (!data) {
+    // Use today_from_jobs even if realtime data is missing
+    return {
+      pressState: "DISCONNECTED",
+      printedJobs: todayFromJobs.jobs || 0,
+      sheets: todayFromJobs.sheets || 0,
+      impressions: todayFromJobs.impressions || 0,
+      impressionsPerHour: 0,
+      error: true
+    };
+  }
+  
+  return {
+    pressState: data.pressState || "UNKNOWN",
+    printedJobs: data.printedJobs || todayFromJobs.jobs || 0,
+    // Use impressions/sheets from Jobs API (more accurate)
+    sheets: todayFromJobs.sheets || data.sheets || 0,
+    impressions: todayFromJobs.impressions || data.impressions || 0,
+    impressionsPerHour: data.impressionsPerHour || 0,
+    lastTimeStateChanged: data.lastTimeStateChanged,
+    currentJobName: data.currentJobName || "-",
+    operatorMessage: data.operatorMessage || "-",
+    printMode: data.printMode || "-",
+    substrateWidth: data.substrateWidth || 0,
+    speed: data.speed || 0
+  };
+};
+
+const toLiveStates = (devices, selectedDevice) => {
+  const results = {};
+  for (const [devId, device] of Object.entries(devices || {})) {
+    if (selectedDevice === "all" || devId === selectedDevice) {
+      results[devId] = toLiveState(device);
+    }
+  }
+  return results;
+};
+
 export default function LiveStatus({ selectedDevice }) {
   const { deviceNames } = useDevices();
   const [realtimeData, setRealtimeData] = useState({});
@@ -33,68 +77,39 @@ export default function LiveStatus({ selectedDevice }) {
 
   useEffect(() => {
     fetchRealtimeData();
-    
-    // Auto-refresh every 30 seconds
-    const interval = setInterval(() => {
-      fetchRealtimeData();
-    }, 30000);
-    
-    return () => clearInterval(interval);
   }, [selectedDevice]);
 
-  const fetchRealtimeData = async () => {
-    setLoading(true);
-    try {
-      const devices = selectedDevice === "all" 
-        ? ["47200413", "47100144", "47100122"]
-        : [selectedDevice];
-      
-      const results = {};
-      for (const devId of devices) {
-        try {
-          const res = await axios.get(`${API_URL}/devices/${devId}/status`);
-          const data = res.data?.data?.data?.[0];
-          const todayFromJobs = res.data?.today_from_jobs || {};
-          
-          if (data) {
-            results[devId] = {
-              pressState: data.pressState || "UNKNOWN",
-              printedJobs: data.printedJobs || todayFromJobs.jobs || 0,
-              // Use impressions/sheets from Jobs API (more accurate)
-              sheets: todayFromJobs.sheets || data.sheets || 0,
-              impressions: todayFromJobs.impressions || data.impressions || 0,
-              impressionsPerHour: data.impressionsPerHour || 0,
-              lastTimeStateChanged: data.lastTimeStateChanged,
-              currentJobName: data.currentJobName || "-",
-              operatorMessage: data.operatorMessage || "-",
-              printMode: data.printMode || "-",
-              substrateWidth: data.substrateWidth || 0,
-              speed: data.speed || 0
-            };
-          } else {
-            // Use today_from_jobs even if realtime data is missing
-            results[devId] = {
-              pressState: "DISCONNECTED",
-              printedJobs: todayFromJobs.jobs || 0,
-              sheets: todayFromJobs.sheets || 0,
-              impressions: todayFromJobs.impressions || 0,
-              impressionsPerHour: 0,
-              error: true
+  // New snapshots are pushed by the server after every RealTimeData poll
+  useLiveEvents({
+    press_status: (event) => {
+      setRealtimeData(toLiveStates(event.devices, selectedDevice));
+      setLastUpdate(new Date());
+    },
+    // Published whenever jobs of today were written, between two press_status events
+    today_counters: (event) => {
+      setRealtimeData((states) => {
+        const next = { ...states };
+        for (const [devId, totals] of Object.entries(event.totals || {})) {
+          if (next[devId]) {
+            next[devId] = {
+              ...next[devId],
+              sheets: totals.sheets || next[devId].sheets,
+              impressions: totals.impressions || next[devId].impressions
             };
           }
-        } catch (e) {
-          console.log(`Failed to get realtime for ${devId}`);
-          results[devId] = {
-            pressState: "DISCONNECTED",
-            printedJobs: 0,
-            sheets: 0,
-            impressions: 0,
-            impressionsPerHour: 0,
-            error: true
-          };
         }
-      }
-      setRealtimeData(results);
+        return next;
+      });
+    }
+  });
+
+  const fetchRealtimeData = async () => {
+    setLoading(true);
+    try {
+      // One request for all presses instead of one per press
+      const params = selectedDevice === "all" ? {} : { ids: selectedDevice };
+      const res = await axios.get(`${API_URL}/devices/status`, { params });
+      setRealtimeData(toLiveStates(res.data?.devices, selectedDevice));
       setLastUpdate(new Date());
     } catch (error) {
       toast.error("Fehler beim Laden der Live-Daten");
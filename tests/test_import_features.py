@@ -0,0 +1,250 @@
+"""
+Backend API Tests for HP PrintOS Dashboard - Job Import Features
+Tests the batched bulk import of jobs exported by the Python script
+and the streaming recategorization of stored jobs
+"""
+import pytest
+import requests
+import os
+import gzip
+import json
+import time
+
+# Get BASE_URL from environment
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Marker range reserved for test jobs so they never collide with real presses
+TEST_MARKER_BASE = 990000000
+
+
+@pytest.fixture(scope="module", autouse=True)
+def remove_test_jobs():
+    """Delete the imported test jobs so they do not end up in reports"""
+    yield
+    requests.delete(f"{BASE_URL}/api/jobs", params={"min_marker": TEST_MARKER_BASE})
+
+
+def make_test_jobs(count, offset=0):
+    """Build jobs in the Python script export format"""
+    return [
+        {
+            "pressSerialNumber": "47200413",
+            "jobName": f"TEST_import_{offset + i}.pdf",
+            "marker": TEST_MARKER_BASE + offset + i,
+            "impressions": 10,
+            "oneShotImpressions": 10,
+            "impressionsNColors": 10,
+            "jobProgress": "PRINTED",
+            "jobSubmitTime": "2020-01-01T08:00:00",
+            "inks": [{"color": "Cyan"}, {"color": "Magenta"}, {"color": "Yellow"}, {"color": "Black"}]
+        }
+        for i in range(count)
+    ]
+
+
+class TestBulkImport:
+    """Tests for POST /api/jobs/import"""
+
+    def test_import_counts_inserted_and_updated(self):
+        """Importing the same jobs twice - second run should only update"""
+        jobs = make_test_jobs(25)
+
+        first = requests.post(f"{BASE_URL}/api/jobs/import", json={"jobs": jobs}, params={"batch_size": 10})
+        assert first.status_code == 200, f"Expected 200, got {first.status_code}"
+
+        data = first.json()
+        for field in ["imported", "updated", "skipped", "errors", "total"]:
+            assert field in data, f"Missing {field} field"
+        assert data["total"] == 25
+        assert data["imported"] + data["updated"] == 25, "Every job should be inserted or updated"
+
+        second = requests.post(f"{BASE_URL}/api/jobs/import", json={"jobs": jobs}, params={"batch_size": 7})
+        assert second.status_code == 200
+
+        data = second.json()
+        assert data["imported"] == 0, f"Re-import should not insert, got {data['imported']}"
+        assert data["updated"] == 25, f"Re-import should update all jobs, got {data['updated']}"
+        print(f"Re-import: {data['updated']} updated in batches of 7")
+
+    def test_import_skips_jobs_without_marker(self):
+        """Jobs without a marker are skipped, not written"""
+        jobs = make_test_jobs(3, offset=100)
+        jobs.append({"jobName": "TEST_no_marker.pdf", "impressions": 1})
+
+        response = requests.post(f"{BASE_URL}/api/jobs/import", json={"jobs": jobs})
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["skipped"] == 1, f"Expected 1 skipped, got {data['skipped']}"
+        assert data["imported"] + data["updated"] == 3
+
+    def test_import_rejects_invalid_batch_size(self):
+        """batch_size must be positive"""
+        response = requests.post(
+            f"{BASE_URL}/api/jobs/import",
+            json={"jobs": make_test_jobs(1, offset=200)},
+            params={"batch_size": 0}
+        )
+        assert response.status_code == 422, f"Expected 422, got {response.status_code}"
+
+
+class TestStreamingImport:
+    """Tests for POST /api/jobs/import/stream"""
+
+    def post_stream(self, body, batch_size=None):
+        params = {"batch_size": batch_size} if batch_size else None
+        return requests.post(
+            f"{BASE_URL}/api/jobs/import/stream",
+            data=body,
+            params=params,
+            headers={"Content-Type": "application/octet-stream"}
+        )
+
+    def test_stream_json_array(self):
+        """A plain JSON array is parsed incrementally"""
+        jobs = make_test_jobs(12, offset=300)
+        response = self.post_stream(json.dumps(jobs).encode(), batch_size=5)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+        data = response.json()
+        assert data["total"] == 12
+        assert data["imported"] + data["updated"] == 12
+
+    def test_stream_ndjson(self):
+        """One job per line"""
+        jobs = make_test_jobs(8, offset=400)
+        body = "\n".join(json.dumps(job) for job in jobs).encode()
+        response = self.post_stream(body)
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["total"] == 8
+        assert data["imported"] + data["updated"] == 8
+
+    def test_stream_gzip_ndjson(self):
+        """gzip-compressed NDJSON is detected from the magic bytes"""
+        jobs = make_test_jobs(8, offset=500)
+        body = gzip.compress("\n".join(json.dumps(job) for job in jobs).encode())
+        response = self.post_stream(body)
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["total"] == 8
+        assert data["errors"] == 0
+
+    def test_stream_invalid_json(self):
+        """Truncated input is reported as 400"""
+        response = self.post_stream(b'[{"marker": 1},')
+        assert response.status_code == 400, f"Expected 400, got {response.status_code}"
+        assert "detail" in response.json()
+
+
+class TestAsyncImport:
+    """Tests for background imports with progress reporting"""
+
+    def wait_for_import(self, import_id, timeout=60):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            response = requests.get(f"{BASE_URL}/api/jobs/import/{import_id}")
+            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+            status = response.json()
+            if status["status"] in ("completed", "failed"):
+                return status
+            time.sleep(0.5)
+        pytest.fail(f"Import {import_id} did not finish within {timeout}s")
+
+    def test_async_import_reports_progress(self):
+        """POST /api/jobs/import/async returns an id that can be polled"""
+        jobs = make_test_jobs(30, offset=600)
+        body = "\n".join(json.dumps(job) for job in jobs).encode()
+        response = requests.post(
+            f"{BASE_URL}/api/jobs/import/async",
+            data=body,
+            params={"batch_size": 10},
+            headers={"Content-Type": "application/octet-stream"}
+        )
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+        data = response.json()
+        assert "import_id" in data, "Missing import_id"
+        assert data["bytes_total"] == len(body)
+
+        status = self.wait_for_import(data["import_id"])
+        assert status["status"] == "completed", f"Import failed: {status.get('error')}"
+        for field in ["processed", "imported", "updated", "errors", "jobs_per_second", "percent"]:
+            assert field in status, f"Missing {field} field"
+        assert status["processed"] == 30
+        assert status["imported"] + status["updated"] == 30
+        assert status["percent"] == 100.0
+
+    def test_async_import_failure_is_recorded(self):
+        """Invalid input ends in status 'failed' with an error message"""
+        response = requests.post(
+            f"{BASE_URL}/api/jobs/import/async",
+            data=b'[{"marker": 1',
+            headers={"Content-Type": "application/octet-stream"}
+        )
+        assert response.status_code == 200
+
+        status = self.wait_for_import(response.json()["import_id"])
+        assert status["status"] == "failed"
+        assert status.get("error"), "Failed import should carry an error"
+
+    def test_unknown_import_id(self):
+        """GET /api/jobs/import/{id} - 404 for unknown ids"""
+        response = requests.get(f"{BASE_URL}/api/jobs/import/does-not-exist")
+        assert response.status_code == 404
+
+
+class TestRecategorize:
+    """Tests for POST /api/jobs/recategorize, limited to the test markers"""
+
+    scope = {"min_marker": TEST_MARKER_BASE}
+
+    def test_recategorize_only_rewrites_changed_jobs(self):
+        """A second run right after the first has nothing left to change"""
+        first = requests.post(f"{BASE_URL}/api/jobs/recategorize", params=self.scope)
+        assert first.status_code == 200, f"Expected 200, got {first.status_code}"
+
+        data = first.json()
+        for field in ["jobs_updated", "jobs_scanned", "jobs_unchanged", "errors"]:
+            assert field in data, f"Missing {field} field"
+
+        second = requests.post(f"{BASE_URL}/api/jobs/recategorize", params={**self.scope, "batch_size": 500}).json()
+        assert second["jobs_updated"] == 0, f"Expected no changes, got {second['jobs_updated']}"
+        assert second["jobs_scanned"] >= data["jobs_scanned"] - 1, "Every job should be scanned"
+        print(f"Recategorize scanned {second['jobs_scanned']} jobs")
+
+    def test_recategorize_background_progress(self):
+        """background=true returns a run_id whose progress can be polled"""
+        response = requests.post(f"{BASE_URL}/api/jobs/recategorize", params={**self.scope, "background": True})
+        assert response.status_code == 200
+
+        run_id = response.json()["run_id"]
+        deadline = time.time() + 120
+        while time.time() < deadline:
+            status = requests.get(f"{BASE_URL}/api/jobs/recategorize/{run_id}").json()
+            if status["status"] in ("completed", "failed"):
+                break
+            time.sleep(1)
+
+        assert status["status"] == "completed", f"Run did not complete: {status}"
+        assert status["percent"] == 100.0
+
+    def test_stale_only_after_full_run(self):
+        """After a run every test job carries the current rules version"""
+        requests.post(f"{BASE_URL}/api/jobs/recategorize", params=self.scope)
+
+        status = requests.get(f"{BASE_URL}/api/jobs/categorization/status")
+        assert status.status_code == 200, f"Expected 200, got {status.status_code}"
+        data = status.json()
+        for field in ["rules_version", "stale_jobs", "upgrade_running"]:
+            assert field in data, f"Missing {field} field"
+
+        response = requests.post(f"{BASE_URL}/api/jobs/recategorize", params={**self.scope, "stale_only": True})
+        assert response.status_code == 200
+        assert response.json()["jobs_updated"] == 0, "No stale jobs should remain"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
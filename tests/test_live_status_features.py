@@ -0,0 +1,113 @@
+"""
+Backend API Tests for HP PrintOS Dashboard - Live Status Features
+Tests the device status endpoints served from the shared RealTimeData snapshot
+the batch status endpoint used by the live page, the live event stream
+and the polled press state history
+"""
+import pytest
+import requests
+import os
+
+# Get BASE_URL from environment
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+DEVICE_ID = "47100122"
+
+
+class TestDeviceStatus:
+    """Tests for GET /api/devices/{device_id}/status"""
+
+    def test_status_reports_snapshot_time(self):
+        """Status carries the RealTimeData entry and the time it was fetched"""
+        response = requests.get(f"{BASE_URL}/api/devices/{DEVICE_ID}/status")
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+        data = response.json()
+        if "error" in data:
+            pytest.skip(f"HP API unavailable: {data['error']}")
+        for field in ["device_id", "status", "today_from_jobs", "snapshot_at"]:
+            assert field in data, f"Missing {field} field"
+        assert "raw" not in data, "Raw HP payload is opt-in"
+
+    def test_raw_status_on_request(self):
+        """raw=true adds the untrimmed RealTimeData entry"""
+        data = requests.get(f"{BASE_URL}/api/devices/{DEVICE_ID}/status", params={"raw": True}).json()
+        if "error" in data:
+            pytest.skip(f"HP API unavailable: {data['error']}")
+        assert "raw" in data, "Missing raw field"
+
+    def test_unknown_device(self):
+        """Unknown devices are reported as 404"""
+        response = requests.get(f"{BASE_URL}/api/devices/does-not-exist/status")
+        assert response.status_code == 404
+
+
+class TestBatchDeviceStatus:
+    """Tests for GET /api/devices/status"""
+
+    def test_all_devices_in_one_response(self):
+        """Without ids every configured press is returned with trimmed status"""
+        response = requests.get(f"{BASE_URL}/api/devices/status")
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+        data = response.json()
+        devices = requests.get(f"{BASE_URL}/api/devices").json()
+        assert set(data["devices"]) == {device["id"] for device in devices}
+
+        for device_id, device in data["devices"].items():
+            for field in ["device_name", "model", "status", "today_from_jobs"]:
+                assert field in device, f"{device_id} missing {field}"
+            assert "raw" not in device, "Raw HP payload should not be passed through"
+
+    def test_selected_devices(self):
+        """ids limits the response to the requested presses"""
+        response = requests.get(f"{BASE_URL}/api/devices/status", params={"ids": DEVICE_ID})
+        assert response.status_code == 200
+        assert list(response.json()["devices"]) == [DEVICE_ID]
+
+    def test_unknown_device_in_batch(self):
+        """An unknown id is reported as 404"""
+        response = requests.get(f"{BASE_URL}/api/devices/status", params={"ids": f"{DEVICE_ID},does-not-exist"})
+        assert response.status_code == 404
+
+
+class TestLiveEvents:
+    """Tests for the Server-Sent Events stream GET /api/events"""
+
+    def test_event_stream_opens(self):
+        """The stream is served as text/event-stream and starts with a retry hint"""
+        with requests.get(f"{BASE_URL}/api/events", stream=True, timeout=10) as response:
+            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+            assert response.headers["content-type"].startswith("text/event-stream")
+            first_line = next(response.iter_lines(decode_unicode=True))
+            assert first_line.startswith("retry:"), f"Unexpected first line: {first_line}"
+
+
+class TestPressHistory:
+    """Tests for GET /api/devices/{device_id}/history"""
+
+    def test_history_structure(self):
+        """Samples and today's state durations with uptime percentages"""
+        response = requests.get(f"{BASE_URL}/api/devices/{DEVICE_ID}/history")
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+        data = response.json()
+        assert isinstance(data["samples"], list)
+        for sample in data["samples"]:
+            for field in ["timestamp", "state", "impressions_per_hour"]:
+                assert field in sample, f"Sample missing {field}"
+
+        today = data["today"]
+        for field in ["printing_seconds", "idle_seconds", "down_seconds", "observed_seconds", "uptime_percent"]:
+            assert field in today, f"Missing {field} field"
+        if today["uptime_percent"] is not None:
+            assert 0 <= today["uptime_percent"] <= 100
+
+    def test_history_unknown_device(self):
+        """Unknown devices are reported as 404"""
+        response = requests.get(f"{BASE_URL}/api/devices/does-not-exist/history")
+        assert response.status_code == 404
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,109 @@
+"""
+Backend API Tests for HP PrintOS Dashboard - Background Sync Features
+Tests the per-device sync checkpoints reported by the sync status endpoint
+"""
+import pytest
+import requests
+import os
+
+# Get BASE_URL from environment
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+
+class TestSyncStatus:
+    """Tests for GET /api/sync/status"""
+
+    def test_sync_status_structure(self):
+        """Status contains the running flag, devices and per-device checkpoints"""
+        response = requests.get(f"{BASE_URL}/api/sync/status")
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+        data = response.json()
+        for field in ["running", "devices", "sync_state", "recent_logs"]:
+            assert field in data, f"Missing {field} field"
+        assert isinstance(data["sync_state"], dict), "sync_state should be keyed by device"
+
+        for device_id, state in data["sync_state"].items():
+            assert device_id in data["devices"], f"Checkpoint for unknown device {device_id}"
+            assert "last_marker" in state, f"Checkpoint of {device_id} missing last_marker"
+            print(f"Device {device_id}: marker {state['last_marker']}, lag {state.get('lag_seconds')}s")
+
+    def test_rate_limits_per_credential_pair(self):
+        """jobs_key and historic_key report their own utilization"""
+        data = requests.get(f"{BASE_URL}/api/sync/status").json()
+        assert "rate_limits" in data, "Missing rate_limits field"
+
+        for name in ["jobs", "historic"]:
+            budget = data["rate_limits"][name]
+            for field in ["requests_last_minute", "limit_per_minute", "utilization_percent", "next_slot_in"]:
+                assert field in budget, f"{name} budget missing {field}"
+            assert 0 <= budget["utilization_percent"] <= 100
+
+
+
+class TestForceResync:
+    """Tests for the resumable POST /api/jobs/force-resync"""
+
+    def test_resync_is_queued_with_progress(self):
+        """A run is queued per device and its progress can be read back"""
+        response = requests.post(f"{BASE_URL}/api/jobs/force-resync", params={"device_id": "47100122", "mode": "gaps"})
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+        data = response.json()
+        assert data["status"] == "queued"
+        assert data["devices"] == ["47100122"]
+
+        status = requests.get(f"{BASE_URL}/api/jobs/force-resync/{data['run_id']}").json()
+        assert status["mode"] == "gaps"
+        assert "47100122" in status["devices"], "Missing per-device progress"
+        for field in ["next_marker", "pages", "jobs_written", "jobs_unchanged", "done"]:
+            assert field in status["devices"]["47100122"], f"Progress missing {field}"
+
+        # Leave nothing running against the HP API after the test
+        requests.post(f"{BASE_URL}/api/jobs/force-resync/{data['run_id']}/cancel")
+
+    def test_resync_rejects_unknown_mode(self):
+        """mode must be gaps or full"""
+        response = requests.post(f"{BASE_URL}/api/jobs/force-resync", params={"mode": "everything"})
+        assert response.status_code == 422, f"Expected 422, got {response.status_code}"
+
+    def test_resync_limit_is_the_page_size(self):
+        """limit is stored as the run's page size and capped at the Jobs API maximum"""
+        response = requests.post(f"{BASE_URL}/api/jobs/force-resync", params={"limit": 100000})
+        assert response.status_code == 422, f"Expected 422, got {response.status_code}"
+
+        data = requests.post(f"{BASE_URL}/api/jobs/force-resync", params={"device_id": "47100122", "limit": 500}).json()
+        status = requests.get(f"{BASE_URL}/api/jobs/force-resync/{data['run_id']}").json()
+        assert status["page_size"] == 500
+        requests.post(f"{BASE_URL}/api/jobs/force-resync/{data['run_id']}/cancel")
+
+    def test_unknown_resync_run(self):
+        """GET /api/jobs/force-resync/{id} - 404 for unknown ids"""
+        response = requests.get(f"{BASE_URL}/api/jobs/force-resync/does-not-exist")
+        assert response.status_code == 404
+
+
+class TestDataRefresh:
+    """Tests for the background POST /api/data/refresh"""
+
+    def test_refresh_is_queued_with_progress(self):
+        """The request returns at once, results are read back by refresh_id"""
+        response = requests.post(f"{BASE_URL}/api/data/refresh", params={"device_id": "47100122"})
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+        data = response.json()
+        assert data["status"] == "queued"
+        assert data["devices"] == ["47100122"]
+
+        status = requests.get(f"{BASE_URL}/api/data/refresh/{data['refresh_id']}").json()
+        for field in ["status", "results", "total_synced", "percent"]:
+            assert field in status, f"Progress missing {field}"
+
+    def test_unknown_refresh(self):
+        """GET /api/data/refresh/{id} - 404 for unknown ids"""
+        response = requests.get(f"{BASE_URL}/api/data/refresh/does-not-exist")
+        assert response.status_code == 404
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -282,5 +282,77 @@ class TestExistingEndpoints:
         assert "success_rate" in data
 
 
+class TestReportCache:
+    """Tests for the versioned report response cache"""
+
+    def test_report_has_etag(self):
+        """Cached reports carry an ETag and must be revalidated"""
+        response = requests.get(f"{BASE_URL}/api/stats/overview")
+        assert response.status_code == 200
+        assert "etag" in response.headers, "Missing ETag header"
+        assert response.headers.get("cache-control") == "no-cache"
+
+    def test_if_none_match_returns_304(self):
+        """Revalidating with the current ETag costs no body"""
+        etag = requests.get(f"{BASE_URL}/api/stats/overview").headers["etag"]
+        response = requests.get(f"{BASE_URL}/api/stats/overview", headers={"If-None-Match": etag})
+        assert response.status_code == 304, f"Expected 304, got {response.status_code}"
+        assert response.content == b""
+
+    def test_parameter_order_is_normalized(self):
+        """The same parameters in another order hit the same entry"""
+        params = "from_date=2024-01-01&to_date=2024-01-31"
+        reordered = "to_date=2024-01-31&from_date=2024-01-01"
+        first = requests.get(f"{BASE_URL}/api/clicks/report?{params}")
+        second = requests.get(f"{BASE_URL}/api/clicks/report?{reordered}")
+        assert first.status_code == second.status_code == 200
+        assert first.headers["etag"] == second.headers["etag"]
+
+
+class TestDashboardBundle:
+    """Tests for GET /api/dashboard and GET /api/clicks/bundle"""
+
+    params = {"from_date": "2024-01-01", "to_date": "2024-01-31"}
+
+    def test_dashboard_structure(self):
+        """Overview and clicks trend in one response"""
+        response = requests.get(f"{BASE_URL}/api/dashboard", params=self.params)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+        data = response.json()
+        for field in ["overview", "clicks_trend", "data_source"]:
+            assert field in data, f"Missing {field} field"
+        assert isinstance(data["clicks_trend"], list)
+        assert "sync_status" not in data, "Sync status would bypass the report cache"
+
+    def test_dashboard_matches_overview(self):
+        """The bundle reports the same totals as /stats/overview"""
+        bundle = requests.get(f"{BASE_URL}/api/dashboard", params=self.params).json()
+        overview = requests.get(f"{BASE_URL}/api/stats/overview", params=self.params).json()
+        assert bundle["overview"]["total_jobs"] == overview["total_jobs"]
+
+    def test_clicks_bundle_structure(self):
+        """Report and trend, plus the YoY parts only when requested"""
+        data = requests.get(f"{BASE_URL}/api/clicks/bundle", params=self.params).json()
+        for field in ["clicks_report", "clicks_trend", "data_source"]:
+            assert field in data, f"Missing {field} field"
+        assert "yoy" not in data
+        assert data["clicks_report"]["data_source"] == data["data_source"]
+
+        report = requests.get(f"{BASE_URL}/api/clicks/report", params=self.params).json()
+        assert data["clicks_report"]["total_impressions"] == report["total_impressions"]
+
+        data = requests.get(f"{BASE_URL}/api/clicks/bundle", params={**self.params, "yoy": True}).json()
+        assert "current_year" in data["yoy"]
+        assert "yoy_trend" in data
+
+    def test_bundles_are_report_cached(self):
+        """Both bundles carry an ETag and revalidate with 304"""
+        for path in ["/api/dashboard", "/api/clicks/bundle"]:
+            etag = requests.get(f"{BASE_URL}{path}", params=self.params).headers["etag"]
+            response = requests.get(f"{BASE_URL}{path}", params=self.params, headers={"If-None-Match": etag})
+            assert response.status_code == 304, f"{path}: expected 304, got {response.status_code}"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])